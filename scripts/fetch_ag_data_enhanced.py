@@ -16,15 +16,24 @@ Previous features:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
 import pandas as pd
-from functools import reduce
+from pandas.api.types import union_categoricals
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import time
+import math
+import random
 import os
-import json
+import io
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Optional, List, Tuple
-from collections import defaultdict
+from collections import defaultdict, deque
 
 # --- Setup Logging -----------------------------------------------------------
 
@@ -52,15 +61,38 @@ COMMON_PARAMS = {
     "source_desc": "CENSUS",
     "year": "2022",
     "agg_level_desc": "COUNTY",
-    "format": "JSON",
+    "format": "CSV",
 }
 
+# Only the columns needed to pick a value per county are parsed out of the
+# API's CSV response; everything is read as text so "(D)" markers survive
+API_CSV_DTYPES = {
+    "short_desc": "category",
+    "state_alpha": "category",
+    "county_name": "category",
+    "domain_desc": "string",
+    "domaincat_desc": "string",
+    "Value": "string",
+}
+
+# Withheld markers, thousands separators and whitespace, stripped in one pass
+# when cleaning text metric columns; whatever is left must be a plain number
+CLEAN_PATTERN = r"\(D\)|[,\s]+"
+NUMBER_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+
 TARGET_STATES = ["OR", "WA", "CA", "NV", "ID", "MT"]
 
 # API Configuration
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
-API_DELAY = 2    # seconds between requests
+RETRY_DELAY = 5  # seconds, base for exponential backoff
+MAX_RETRY_DELAY = 60  # seconds, backoff cap (before jitter)
+# short_desc values batched into one request. Not sized against the API's
+# record limit: an oversized batch is rejected without retries and its
+# metrics fall back to per-metric requests.
+MAX_DESCS_PER_REQUEST = 10
+METRIC_WORKERS = 4  # metrics loaded/fetched concurrently in main
+API_MAX_REQUESTS = 1   # requests allowed per API_RATE_WINDOW (across all threads)
+API_RATE_WINDOW = 2    # seconds; 1 per 2s matches the old fixed API_DELAY pacing
 
 # --- Metrics Dictionary ------------------------------------------------------
 
@@ -125,42 +157,140 @@ METRICS = {
 CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cache")
 os.makedirs(CACHE_DIR, exist_ok=True)
 
+# In-process memo of parsed metric frames so repeat calls skip the disk cache
+_MEMO: Dict[tuple, pd.DataFrame] = {}
+_MEMO_LOCK = threading.Lock()
+
+# --- Rate Limiting -----------------------------------------------------------
+
+class RateLimiter:
+    """
+    Sliding-window rate limiter shared by all worker threads.
+    Allows at most `max_calls` requests in any `period` seconds.
+    """
+
+    def __init__(self, max_calls: int, period: float):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._guard = threading.Semaphore(1)
+
+    def acquire(self):
+        """Block until a request slot is available, then claim it."""
+        while True:
+            with self._guard:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+
+                wait = self.period - (now - self._calls[0])
+
+            time.sleep(wait)
+
+
+API_LIMITER = RateLimiter(API_MAX_REQUESTS, API_RATE_WINDOW)
+
+# --- HTTP Session ------------------------------------------------------------
+
+# One pooled keep-alive session for every request so connections (and TLS
+# handshakes) are reused across states and metrics. Retries are handled by
+# fetch_with_retry, so urllib3's own retries are disabled (max_retries=0
+# also keeps read timeouts raised as requests Timeout, not ConnectionError).
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0))
+
 # --- Helper Functions --------------------------------------------------------
 
-def fetch_with_retry(url: str, params: dict, max_retries: int = MAX_RETRIES) -> Optional[dict]:
+def fetch_with_retry(url: str, params: dict, max_retries: int = MAX_RETRIES, retry_client_errors: bool = True) -> Optional[bytes]:
     """
     Fetch data from API with retry logic.
-    Returns the JSON response or None if all retries failed.
+    Returns the raw response body or None if all retries failed.
+
+    With retry_client_errors=False, a 4xx other than 429 (e.g. a query over
+    the API's record limit) returns None immediately instead of retrying.
     """
     for attempt in range(max_retries):
+        # Exponential backoff with jitter so concurrent callers don't retry in lockstep
+        delay = min(MAX_RETRY_DELAY, RETRY_DELAY * (2 ** attempt)) + random.random() * RETRY_DELAY
+
         try:
-            logger.debug(f"API Request (attempt {attempt + 1}/{max_retries}): {params.get('short_desc', 'Unknown')} - {params.get('state_alpha', 'Unknown')}")
+            logger.debug("API Request (attempt %d/%d): %s - %s", attempt + 1, max_retries, params.get("short_desc", "Unknown"), params.get("state_alpha", "Unknown"))
 
-            r = requests.get(url, params=params, timeout=30)
+            API_LIMITER.acquire()
+            r = SESSION.get(url, params=params, timeout=(5, 30))  # (connect, read)
 
             if r.status_code == 200:
-                data = r.json()
-                return data
-            elif r.status_code == 429:  # Rate limit
-                logger.warning(f"Rate limited. Waiting {RETRY_DELAY * 2} seconds...")
-                time.sleep(RETRY_DELAY * 2)
+                return r.content
+            elif r.status_code == 429:  # Rate limit - honor the server's Retry-After
+                try:
+                    retry_after = float(r.headers.get("Retry-After", delay))
+                except ValueError:  # HTTP-date form
+                    retry_after = delay
+                # Clamped so a bogus or huge value can't stall a worker or break sleep()
+                if math.isfinite(retry_after):
+                    delay = min(max(retry_after, 0), MAX_RETRY_DELAY)
+                logger.warning("Rate limited on attempt %d (retry after %.1fs)", attempt + 1, delay)
             else:
-                logger.warning(f"HTTP {r.status_code}: {r.text[:200]}")
+                logger.warning("HTTP %d: %s", r.status_code, r.text[:200])
+                if not retry_client_errors and 400 <= r.status_code < 500:
+                    return None
 
         except requests.exceptions.Timeout:
-            logger.warning(f"Timeout on attempt {attempt + 1}")
+            logger.warning("Timeout on attempt %d", attempt + 1)
         except requests.exceptions.RequestException as e:
-            logger.warning(f"Request error: {e}")
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
+            logger.warning("Request error: %s", e)
 
+        # Single sleep point, skipped when there is no next attempt
         if attempt < max_retries - 1:
-            time.sleep(RETRY_DELAY)
+            time.sleep(delay)
 
-    logger.error(f"All {max_retries} attempts failed for {params.get('short_desc', 'Unknown')}")
+    logger.error("All %d attempts failed for %s", max_retries, params.get("short_desc", "Unknown"))
     return None
 
 
+def cache_path(metric_name: str) -> str:
+    """Path of the Parquet cache file for a metric."""
+    return os.path.join(CACHE_DIR, f"{metric_name}.parquet")
+
+
+def is_cached(metric_name: str) -> bool:
+    """Whether a metric has a cache file (Parquet, or a legacy CSV to migrate)."""
+    return (
+        os.path.exists(cache_path(metric_name))
+        or os.path.exists(os.path.join(CACHE_DIR, f"{metric_name}.csv"))
+    )
+
+
+def write_cache(df: pd.DataFrame, cache_file: str):
+    """
+    Write a metric cache file atomically, so a run killed mid-write never
+    leaves a truncated Parquet file for the next run to trip over.
+    """
+    tmp_file = f"{cache_file}.tmp"
+    df.to_parquet(tmp_file, engine="pyarrow", compression="snappy", index=False)
+    os.replace(tmp_file, cache_file)
+
+
+def parse_api_csv(content: Optional[bytes]) -> pd.DataFrame:
+    """
+    Parse a QuickStats CSV response into a DataFrame of API_CSV_DTYPES columns.
+    Returns an empty DataFrame if there is no content.
+    """
+    if not content or not content.strip():
+        return pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in API_CSV_DTYPES.items()})
+
+    return pd.read_csv(
+        io.BytesIO(content),
+        usecols=list(API_CSV_DTYPES),
+        dtype=API_CSV_DTYPES,
+        keep_default_na=False,
+    )
+
+
 def process_county_records(records: List[dict]) -> Tuple[Optional[float], bool]:
     """
     Process all records for a single county and determine the best value.
@@ -221,51 +351,104 @@ def process_county_records(records: List[dict]) -> Tuple[Optional[float], bool]:
 
 
 def fetch_metric_multistate(short_desc: str, metric_name: str, extra_params: dict = None) -> pd.DataFrame:
+    """
+    Fetches data for a specific metric, memoized in-process.
+    Returns a copy so callers can modify the result freely.
+    """
+    key = (short_desc, metric_name, frozenset(extra_params.items()) if extra_params else None)
+
+    with _MEMO_LOCK:
+        cached = _MEMO.get(key)
+    if cached is not None:
+        return cached.copy()
+
+    df = _load_or_fetch_metric(short_desc, metric_name, extra_params)
+
+    # Don't memoize empty results so a later call can retry the API
+    if not df.empty:
+        with _MEMO_LOCK:
+            _MEMO[key] = df
+    return df.copy()
+
+
+def _load_or_fetch_metric(short_desc: str, metric_name: str, extra_params: dict = None) -> pd.DataFrame:
     """
     Fetches data for a specific metric across all TARGET_STATES with caching.
 
     Enhanced approach:
+    - Fetches all TARGET_STATES in a single request
     - Fetches ALL domain categories at once (no domain_desc filter)
     - Groups records by county
     - Intelligently selects total vs. summed subcategories for each county
     """
     # Check cache first
-    cache_file = os.path.join(CACHE_DIR, f"{metric_name}.csv")
+    cache_file = cache_path(metric_name)
+    legacy_cache_file = os.path.join(CACHE_DIR, f"{metric_name}.csv")
+
+    # One-time migration of CSV caches from older runs
+    if not os.path.exists(cache_file) and os.path.exists(legacy_cache_file):
+        logger.info("Migrating %s cache from CSV to Parquet", metric_name)
+        write_cache(pd.read_csv(legacy_cache_file), cache_file)
+        os.remove(legacy_cache_file)
+
     if os.path.exists(cache_file):
-        logger.info(f"Loading {metric_name} from cache")
-        return pd.read_csv(cache_file)
+        logger.info("Loading %s from cache", metric_name)
+        return pd.read_parquet(cache_file, engine="pyarrow")
 
-    all_counties_data = []
-    total_estimated = 0
-    total_actual = 0
-    total_missing = 0
+    # One request covers every state: requests encodes the list as repeated
+    # state_alpha=OR&state_alpha=WA&... parameters
+    params = COMMON_PARAMS.copy()
+    params["short_desc"] = short_desc
+    params["state_alpha"] = TARGET_STATES
+    # NOTE: We're NOT setting domain_desc - fetch ALL domains!
 
-    for state in TARGET_STATES:
-        params = COMMON_PARAMS.copy()
-        params["short_desc"] = short_desc
-        params["state_alpha"] = state
-        # NOTE: We're NOT setting domain_desc - fetch ALL domains!
+    if extra_params:
+        params.update(extra_params)
 
-        if extra_params:
-            params.update(extra_params)
+    logger.info("Fetching %s for %s...", metric_name, ", ".join(TARGET_STATES))
 
-        logger.info(f"Fetching {metric_name} for {state}...")
+    records_df = parse_api_csv(fetch_with_retry(BASE_URL, params))
+    logger.info("  Retrieved %d records from API", len(records_df))
 
-        data = fetch_with_retry(BASE_URL, params)
+    combined_df = build_metric_frame(records_df, metric_name)
 
-        if not data or "data" not in data or len(data["data"]) == 0:
-            logger.warning(f"✗ {state}: No data available")
-            continue
+    if not combined_df.empty:
+        # Cache the result
+        write_cache(combined_df, cache_file)
+        logger.info("Cached %s (%d total records)", metric_name, len(combined_df))
+
+    return combined_df
+
+
+def build_metric_frame(records_df: pd.DataFrame, metric_name: str) -> pd.DataFrame:
+    """
+    Turn the raw API records for one metric into one row per county.
+    Returns an empty DataFrame if no county has a usable value.
+    """
+    # Output columns are collected side by side rather than as per-row dicts
+    out_states: List[str] = []
+    out_counties: List[str] = []
+    out_values: List[float] = []
+    out_estimated: List[bool] = []
+    total_estimated = 0
+    total_actual = 0
+    total_missing = 0
 
-        records = data["data"]
-        logger.info(f"  Retrieved {len(records)} records from API")
+    # Split the combined response back out by state
+    state_groups = dict(tuple(records_df.groupby("state_alpha", observed=True)))
+
+    for state in TARGET_STATES:
+        state_df = state_groups.get(state)
+        if state_df is None or state_df.empty:
+            logger.warning("✗ %s: No data available", state)
+            continue
 
         # Group records by county
-        county_records = defaultdict(list)
-        for record in records:
-            county = record.get("county_name", "")
-            if county:
-                county_records[county].append(record)
+        county_records = {
+            county: county_df.to_dict("records")
+            for county, county_df in state_df.groupby("county_name", observed=True, sort=False)
+            if county
+        }
 
         # Process each county
         state_estimated = 0
@@ -276,13 +459,10 @@ def fetch_metric_multistate(short_desc: str, metric_name: str, extra_params: dic
             value, is_estimated = process_county_records(county_data)
 
             if value is not None:
-                all_counties_data.append({
-                    "state_name": state,
-                    "county_name": county,
-                    "year": 2022,
-                    "Value": value,
-                    "is_estimated": is_estimated
-                })
+                out_states.append(state)
+                out_counties.append(county)
+                out_values.append(value)
+                out_estimated.append(is_estimated)
 
                 if is_estimated:
                     state_estimated += 1
@@ -294,28 +474,93 @@ def fetch_metric_multistate(short_desc: str, metric_name: str, extra_params: dic
                 state_missing += 1
                 total_missing += 1
 
-        logger.info(f"✓ {state}: {state_actual + state_estimated} counties ({state_actual} actual, {state_estimated} estimated, {state_missing} missing)")
-        time.sleep(API_DELAY)
+        logger.info("✓ %s: %d counties (%d actual, %d estimated, %d missing)", state, state_actual + state_estimated, state_actual, state_estimated, state_missing)
 
     # Summary
-    logger.info(f"Summary for {metric_name}:")
-    logger.info(f"  ✓ Actual totals: {total_actual}")
-    logger.info(f"  ≈ Estimated from subcategories: {total_estimated}")
-    logger.info(f"  ✗ No data: {total_missing}")
+    logger.info("Summary for %s:", metric_name)
+    logger.info("  ✓ Actual totals: %d", total_actual)
+    logger.info("  ≈ Estimated from subcategories: %d", total_estimated)
+    logger.info("  ✗ No data: %d", total_missing)
 
-    if not all_counties_data:
-        logger.warning(f"No data collected for {metric_name}")
+    if not out_values:
+        logger.warning("No data collected for %s", metric_name)
         return pd.DataFrame()
 
-    combined_df = pd.DataFrame(all_counties_data)
-
-    # Cache the result
-    combined_df.to_csv(cache_file, index=False)
-    logger.info(f"Cached {metric_name} ({len(combined_df)} total records)")
+    combined_df = pd.DataFrame({
+        "state_name": out_states,
+        "county_name": out_counties,
+        "year": 2022,
+        "Value": out_values,
+        "is_estimated": out_estimated,
+    })
 
     return combined_df
 
 
+def prefetch_metrics(metrics: Dict[str, Tuple[str, Optional[dict]]]):
+    """
+    Fetch all uncached metrics in as few API requests as possible and cache them.
+
+    Metrics that share the same extra params are requested together, up to
+    MAX_DESCS_PER_REQUEST short_desc values (for every TARGET_STATE) per call,
+    and the response is split back out by short_desc. Metrics whose batch
+    fails or comes back empty are left uncached so fetch_metric_multistate
+    retries them one at a time.
+    """
+    groups = defaultdict(list)
+    for col_name, (desc, extras) in metrics.items():
+        if not is_cached(col_name):
+            groups[frozenset(extras.items()) if extras else None].append((col_name, desc))
+
+    for extras_key, group in groups.items():
+        for start in range(0, len(group), MAX_DESCS_PER_REQUEST):
+            batch = group[start:start + MAX_DESCS_PER_REQUEST]
+
+            params = COMMON_PARAMS.copy()
+            params["short_desc"] = [desc for _, desc in batch]
+            params["state_alpha"] = TARGET_STATES
+            if extras_key:
+                params.update(dict(extras_key))
+
+            logger.info("Batch fetching %d metrics: %s", len(batch), ", ".join(col for col, _ in batch))
+
+            # A bad batch (unexpected body, parse or cache write error) must not
+            # abort the run; its metrics just stay uncached for the fallback
+            try:
+                # Don't retry rejected batches; the per-metric fallback takes over
+                records_df = parse_api_csv(fetch_with_retry(BASE_URL, params, retry_client_errors=False))
+                logger.info("  Retrieved %d records from API", len(records_df))
+
+                desc_groups = dict(tuple(records_df.groupby("short_desc", observed=True)))
+
+                for col_name, desc in batch:
+                    combined_df = build_metric_frame(desc_groups.get(desc, records_df.iloc[:0]), col_name)
+                    if not combined_df.empty:
+                        write_cache(combined_df, cache_path(col_name))
+                        logger.info("Cached %s (%d total records)", col_name, len(combined_df))
+
+            except Exception as e:
+                logger.error("✗ Batch fetch failed, falling back to per-metric requests: %s", e, exc_info=True)
+
+
+def to_numeric_column(series: pd.Series) -> pd.Series:
+    """
+    Convert a metric column to float64, treating "(D)" and other non-numeric
+    values as NaN. Numeric columns are passed through untouched.
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype("float64")
+
+    # Clean and cast with Arrow compute kernels over the whole string buffer
+    # astype("string") first so object columns mixing numbers and text convert cleanly
+    arr = pa.array(series.astype("string"), type=pa.string())
+    cleaned = pc.replace_substring_regex(arr, pattern=CLEAN_PATTERN, replacement="")
+    valid = pc.match_substring_regex(cleaned, pattern=NUMBER_PATTERN)
+    numbers = pc.cast(pc.if_else(valid, cleaned, pa.scalar(None, pa.string())), pa.float64())
+
+    return pd.Series(numbers.to_numpy(zero_copy_only=False), index=series.index, name=series.name)
+
+
 def validate_data(df: pd.DataFrame, metric_name: str) -> Dict[str, any]:
     """
     Validate fetched data and return statistics.
@@ -340,8 +585,67 @@ def validate_data(df: pd.DataFrame, metric_name: str) -> Dict[str, any]:
     return stats
 
 
+def write_output_csv(df: pd.DataFrame, path: str):
+    """
+    Write the final dataset with Arrow's CSV writer.
+
+    The dashboard splits lines on bare commas, so nothing is quoted: the header
+    is written by hand (Arrow always quotes column names) and values are
+    written with quoting_style="none". That means text values can't contain
+    commas, quotes or newlines; such values raise a ValueError naming the
+    offending column before anything is written.
+    """
+    for col in df.columns:
+        if pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        values = df[col].dropna().astype(str)
+        bad = values[values.str.contains(r'[,"\r\n]', regex=True)]
+        if not bad.empty:
+            raise ValueError(
+                f"Column {col!r} has {len(bad)} value(s) containing commas, quotes or newlines "
+                f"(e.g. {bad.iloc[0]!r}), which ag_data.csv cannot hold unquoted"
+            )
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    with open(path, "wb") as f:
+        f.write((",".join(table.column_names) + "\n").encode("utf-8"))
+        pacsv.write_csv(table, f, pacsv.WriteOptions(include_header=False, quoting_style="none"))
+
+
 # --- Main Script Logic -------------------------------------------------------
 
+def process_metric(idx: int, col_name: str, desc: str, extras: Optional[dict]) -> Tuple[Optional[pd.DataFrame], dict]:
+    """
+    Load or fetch a single metric and prepare it for merging.
+    Returns (frame or None, fetch stats).
+    """
+    logger.info(f"[{idx}/{len(METRICS)}] Fetching: {col_name} (API Query: {desc})")
+
+    try:
+        df = fetch_metric_multistate(desc, col_name, extra_params=extras)
+
+        if df.empty:
+            logger.warning(f"✗ {col_name} returned no data")
+            return (None, {'metric': col_name, 'total_rows': 0, 'error': 'No data'})
+
+        # Rename Value column to metric name
+        df.rename(columns={"Value": col_name}, inplace=True)
+
+        # Rename is_estimated to metric_estimated
+        if "is_estimated" in df.columns:
+            df.rename(columns={"is_estimated": f"{col_name}_estimated"}, inplace=True)
+
+        stats = validate_data(df, col_name)
+
+        logger.info(f"✓ {col_name} fetched successfully: {stats['total_rows']} rows ({stats.get('estimated_values', 0)} estimated)")
+        return (df, stats)
+
+    except Exception as e:
+        logger.error(f"✗ CRITICAL ERROR processing {col_name}: {e}", exc_info=True)
+        return (None, {'metric': col_name, 'error': str(e)})
+
+
 def main():
     logger.info("=" * 80)
     logger.info("USDA NASS QuickStats Data Fetch - ENHANCED VERSION")
@@ -356,36 +660,28 @@ def main():
 
     total_metrics = len(METRICS)
 
-    for idx, (col_name, (desc, extras)) in enumerate(METRICS.items(), 1):
-        logger.info(f"\n[{idx}/{total_metrics}] Fetching: {col_name}")
-        logger.info(f"API Query: {desc}")
-
-        try:
-            df = fetch_metric_multistate(desc, col_name, extra_params=extras)
-
-            if not df.empty:
-                # Rename Value column to metric name
-                df.rename(columns={"Value": col_name}, inplace=True)
-
-                # Rename is_estimated to metric_estimated
-                if "is_estimated" in df.columns:
-                    df.rename(columns={"is_estimated": f"{col_name}_estimated"}, inplace=True)
-
-                frames.append(df)
-
-                stats = validate_data(df, col_name)
-                fetch_stats.append(stats)
-
-                logger.info(f"✓ {col_name} fetched successfully: {stats['total_rows']} rows ({stats.get('estimated_values', 0)} estimated)")
-            else:
-                logger.warning(f"✗ {col_name} returned no data")
-                fetch_stats.append({'metric': col_name, 'total_rows': 0, 'error': 'No data'})
-
-        except Exception as e:
-            logger.error(f"✗ CRITICAL ERROR processing {col_name}: {e}", exc_info=True)
-            fetch_stats.append({'metric': col_name, 'error': str(e)})
-
-        logger.info("-" * 80)
+    # Every fetched metric is checkpointed to CACHE_DIR, so a rerun after a
+    # crash only hits the API for the metrics that are still missing
+    cached_metrics = [col for col in METRICS if is_cached(col)]
+    if cached_metrics:
+        logger.info(f"Resuming: {len(cached_metrics)}/{total_metrics} metrics already cached")
+
+    # Pull everything still missing in a handful of batched requests; the
+    # per-metric loop below then mostly reads from cache
+    prefetch_metrics(METRICS)
+
+    # Load/fetch metrics concurrently; API_LIMITER still caps the combined
+    # request rate. map() keeps results in METRICS order.
+    descs, extras_list = zip(*METRICS.values())
+    with ThreadPoolExecutor(max_workers=METRIC_WORKERS) as executor:
+        results = list(executor.map(
+            process_metric, range(1, total_metrics + 1), METRICS.keys(), descs, extras_list
+        ))
+
+    for df, stats in results:
+        if df is not None:
+            frames.append(df)
+        fetch_stats.append(stats)
 
     # --- Summary Report ---
     logger.info("\n" + "=" * 80)
@@ -414,12 +710,24 @@ def main():
 
     logger.info(f"Merging {len(frames)} dataframes...")
 
-    merged = reduce(
-        lambda left, right: pd.merge(
-            left, right, on=["state_name", "county_name", "year"], how="outer"
-        ),
-        frames,
-    )
+    # Index every frame on the shared keys and align them all in a single
+    # concat, rather than merging pairwise. Duplicate keys within a frame are
+    # collapsed first so concat doesn't multiply rows, and the union of keys is
+    # sorted to match the row order the old outer merge produced.
+    key_cols = ["state_name", "county_name", "year"]
+
+    # Use categorical keys sharing one category set across all frames, so the
+    # alignment hashes small integer codes instead of Python strings. The
+    # categories are sorted so the sorted concat below orders rows lexically.
+    for key in ("state_name", "county_name"):
+        categories = union_categoricals([pd.Categorical(df[key]) for df in frames], sort_categories=True).categories
+        for df in frames:
+            df[key] = pd.Categorical(df[key], categories=categories)
+    for df in frames:
+        df["year"] = df["year"].astype("int16")
+
+    indexed = [df.set_index(key_cols).groupby(level=[0, 1, 2], observed=True).first() for df in frames]
+    merged = pd.concat(indexed, axis=1, join="outer", sort=True).reset_index()
 
     logger.info(f"✓ Merged successfully: {len(merged)} rows")
 
@@ -429,21 +737,24 @@ def main():
     logger.info("=" * 80)
 
     # Get all metric columns (excluding _estimated flag columns)
-    metric_cols = [col for col in METRICS.keys() if col in merged.columns]
+    # Column names as a set, so membership checks below are hash lookups
+    merged_cols = frozenset(merged.columns)
+    metric_cols = [col for col in METRICS if col in merged_cols]
 
     logger.info(f"Cleaning {len(metric_cols)} columns...")
 
-    for col in metric_cols:
-        original_nulls = merged[col].isna().sum()
-
-        # Ensure numeric type (should already be numeric from our fetch function)
-        merged[col] = pd.to_numeric(merged[col], errors='coerce')
+    # Ensure numeric type across the whole block in one pass (values should
+    # already be numeric from our fetch function; text columns are stripped of
+    # thousands separators before conversion)
+    block = merged[metric_cols]
+    original_nulls = block.isna().sum()
 
-        new_nulls = merged[col].isna().sum()
-        converted = new_nulls - original_nulls
+    block = block.apply(to_numeric_column)
+    merged[metric_cols] = block
 
-        if converted > 0:
-            logger.info(f"  {col}: {converted} values converted to NaN (invalid data)")
+    converted = block.isna().sum() - original_nulls
+    for col, count in converted[converted > 0].items():
+        logger.info(f"  {col}: {count} values converted to NaN (invalid data)")
 
     # --- Data Completeness Report ---
     logger.info("\n" + "=" * 80)
@@ -454,26 +765,21 @@ def main():
     logger.info(f"Total counties in dataset: {total_counties}")
     logger.info("")
 
-    for col in metric_cols:
-        non_null = merged[col].notna().sum()
-        pct = (non_null / total_counties) * 100
+    # Build the whole report with columnar reductions, then just log it
+    report = pd.DataFrame({"non_null": merged[metric_cols].notna().sum()})
+    report["pct"] = report["non_null"] / total_counties * 100
 
-        # Check if we have estimated values
-        estimated_col = f"{col}_estimated"
-        estimated_count = 0
-        if estimated_col in merged.columns:
-            estimated_count = merged[estimated_col].sum()
+    # Check if we have estimated values
+    estimated_col_map = {f"{col}_estimated": col for col in metric_cols if f"{col}_estimated" in merged_cols}
+    estimated_counts = merged[list(estimated_col_map)].eq(True).sum().rename(estimated_col_map)
+    report["estimated"] = estimated_counts.reindex(report.index, fill_value=0)
 
-        # Symbol
-        if pct > 50:
-            symbol = "✓"
-        elif pct > 10:
-            symbol = "⚠"
-        else:
-            symbol = "✗"
+    report["symbol"] = np.where(report["pct"] > 50, "✓", np.where(report["pct"] > 10, "⚠", "✗"))
 
-        est_str = f" ({estimated_count} estimated)" if estimated_count > 0 else ""
-        logger.info(f"{symbol} {col:35s} : {non_null:3d}/{total_counties} ({pct:5.1f}%){est_str}")
+    if logger.isEnabledFor(logging.INFO):
+        for row in report.itertuples():
+            est_str = f" ({row.estimated} estimated)" if row.estimated > 0 else ""
+            logger.info(f"{row.symbol} {row.Index:35s} : {row.non_null:3d}/{total_counties} ({row.pct:5.1f}%){est_str}")
 
     # --- Save Output ---
     logger.info("\n" + "=" * 80)
@@ -488,7 +794,7 @@ def main():
     estimated_cols = [col for col in merged.columns if col.endswith("_estimated")]
     output_df = merged.drop(columns=estimated_cols)
 
-    output_df.to_csv(output_file, index=False)
+    write_output_csv(output_df, output_file)
     logger.info(f"✓ Saved to: {output_file}")
     logger.info(f"  Rows: {len(output_df)}")
     logger.info(f"  Columns: {len(output_df.columns)}")